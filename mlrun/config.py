@@ -128,6 +128,12 @@ default_config = {
     "redis": {
         "url": "",
         "type": "standalone",  # deprecated.
+        # max connections per redis node, None keeps the pool unbounded. note that the pool doesn't block when
+        # the limit is reached, a command which needs a new connection fails with "Too many connections"
+        "connections_pool_size": None,
+        # seconds of idleness after which a pooled connection is health-checked before being reused,
+        # applies only to standalone redis (redis-py doesn't pass it to the cluster nodes)
+        "health_check_interval": 30,
     },
     "sql": {
         "url": "",
@@ -12,6 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import functools
+import os
+import socket
+import threading
 from urllib.parse import urlparse
 
 import redis
@@ -20,6 +25,108 @@ import redis.cluster
 import mlrun
 
 from .base import DataStore
+from .helpers import ONE_MB
+
+# clients by url, the oldest are dropped once the limit is reached (e.g. as credentials are rotated), an
+# evicted client is closed once the stores still holding it are gone
+_redis_clients = collections.OrderedDict()
+_max_redis_clients = 16
+# guards the dicts, the clients are created under a lock per url so a slow url doesn't block the others
+_redis_clients_lock = threading.Lock()
+_redis_url_locks = {}
+
+# probe idle pooled connections early so dead ones are detected before being reused, the options are not
+# available on all platforms (e.g. TCP_KEEPIDLE on macOS)
+_socket_keepalive_options = {
+    getattr(socket, option): value
+    for option, value in (
+        ("TCP_KEEPIDLE", 60),
+        ("TCP_KEEPINTVL", 30),
+        ("TCP_KEEPCNT", 3),
+    )
+    if hasattr(socket, option)
+}
+
+_redis_url_prefixes = ("redis://", "rediss://", "ds://")
+
+# scan a single page of keys matching ARGV[2] starting at cursor ARGV[1] and unlink them on the server,
+# returns the next cursor. unlinking is batched since lua's unpack is limited in the number of values.
+# standalone redis only - on a cluster every key is in a slot of its own, so a multi-key UNLINK is rejected
+_unlink_scan_page_script = """
+local result = redis.call("SCAN", ARGV[1], "MATCH", ARGV[2], "COUNT", ARGV[3])
+local keys = result[2]
+for i = 1, #keys, 1000 do
+    redis.call("UNLINK", unpack(keys, i, math.min(i + 999, #keys)))
+end
+return result[1]
+"""
+
+
+@functools.lru_cache(maxsize=1024)
+def build_redis_key(key, prefix_only=False):
+    """
+    convert an mlrun url/path to the key as stored in redis (memoized, as the same keys are used repeatedly)
+    """
+    start = 0
+    if key.startswith(_redis_url_prefixes):
+        start = key.find("://") + len("://")
+    # skip over user/pass, host, port
+    start = key.find("/", start)
+    # insert the prefix '{' hashtag to the key as stored in redis
+    key = "{" + key[start:]
+    if prefix_only is False:
+        key += "}"
+
+    return key
+
+
+def build_mlrun_key(key):
+    """
+    convert a key as stored in redis back to the mlrun path
+    """
+    return key[len("{") : -len("}")]
+
+
+def _create_redis_client(url):
+    kwargs = {
+        "socket_keepalive": True,
+        "socket_keepalive_options": _socket_keepalive_options,
+        "retry_on_timeout": True,
+    }
+    pool_size = mlrun.mlconf.redis.connections_pool_size
+    if pool_size is not None:
+        kwargs["max_connections"] = int(pool_size)
+    try:
+        return redis.cluster.RedisCluster.from_url(url, **kwargs)
+    except redis.cluster.RedisClusterException:
+        # the cluster client drops health_check_interval from the nodes' connection kwargs
+        return redis.Redis.from_url(
+            url,
+            health_check_interval=int(mlrun.mlconf.redis.health_check_interval),
+            **kwargs,
+        )
+
+
+def _get_redis_client(url):
+    """
+    return the client for the given url, shared by all the RedisStore instances of the process so the
+    cluster topology discovery and the connection pools are not recreated per store
+    """
+    client = _redis_clients.get(url)
+    if client is not None:
+        return client
+    with _redis_clients_lock:
+        url_lock = _redis_url_locks.setdefault(url, threading.Lock())
+    with url_lock:
+        client = _redis_clients.get(url)
+        if client is None:
+            client = _create_redis_client(url)
+            with _redis_clients_lock:
+                _redis_clients[url] = client
+                while len(_redis_clients) > _max_redis_clients:
+                    evicted_url, _ = _redis_clients.popitem(last=False)
+                    _redis_url_locks.pop(evicted_url, None)
+    return client
 
 
 class RedisStore(DataStore):
@@ -30,6 +137,12 @@ class RedisStore(DataStore):
     - key and value sizes are limited to 512MB
     """
 
+    # upload/download chunk size and the number of chunks queued in a pipeline per round-trip
+    chunk_size = 4 * ONE_MB
+    chunks_per_flush = 8
+    # number of keys scanned by the server per round-trip on listdir and recursive rm
+    scan_count = 10000
+
     def __init__(self, parent, schema, name, endpoint="", secrets: dict = None):
         REDIS_DEFAULT_PORT = "6379"
         super().__init__(parent, name, schema, endpoint, secrets=secrets)
@@ -62,14 +175,7 @@ class RedisStore(DataStore):
     @property
     def redis(self):
         if self._redis is None:
-            try:
-                self._redis = redis.cluster.RedisCluster.from_url(
-                    self._redis_url, decode_responses=True
-                )
-            except redis.cluster.RedisClusterException:
-                self._redis = redis.Redis.from_url(
-                    self._redis_url, decode_responses=True
-                )
+            self._redis = _get_redis_client(self._redis_url)
 
         return self._redis
 
@@ -79,36 +185,34 @@ class RedisStore(DataStore):
     def supports_isdir(self):
         return False
 
-    @classmethod
-    def build_redis_key(cls, key, prefix_only=False):
-        prefixes = ["redis://", "rediss://", "ds://"]
-        start = next((len(prefix) for prefix in prefixes if key.startswith(prefix)), 0)
-        # skip over user/pass, host, port
-        start = key.find("/", start)
-        # insert the prefix '{' hashtag to the key as stored in redis
-        key = "{" + key[start:]
-        if prefix_only is False:
-            key += "}"
-
-        return key
-
-    @classmethod
-    def build_mlrun_key(cls, key):
-        key = key[len("{") : -len("}")]
-
-        return key
+    # kept on the class for backwards compatibility, the module level functions are called directly
+    build_redis_key = staticmethod(build_redis_key)
+    build_mlrun_key = staticmethod(build_mlrun_key)
 
     def upload(self, key, src_path):
-        key = RedisStore.build_redis_key(key)
+        key = build_redis_key(key)
+        if os.path.getsize(src_path) <= self.chunk_size:
+            # a file that fits in a single chunk is written with one SET
+            with open(src_path, "rb") as f:
+                self.redis.set(key, f.read())
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
         with open(src_path, "rb") as f:
+            # the first chunk replaces any existing value, the rest are appended to it
+            pipe.set(key, f.read(self.chunk_size))
             while True:
-                data = f.read(1000 * 1000)
+                data = f.read(self.chunk_size)
                 if not data:
                     break
-                self.redis.append(key, data)
+                pipe.append(key, data)
+                if len(pipe) >= self.chunks_per_flush:
+                    pipe.execute()
+        if len(pipe):
+            pipe.execute()
 
     def get(self, key, size=None, offset=0):
-        key = RedisStore.build_redis_key(key)
+        key = build_redis_key(key)
         if offset < 0:
             raise mlrun.errors.MLRunInvalidArgumentError(
                 "offset argument should be >= 0"
@@ -123,8 +227,44 @@ class RedisStore(DataStore):
 
         return self.redis.getrange(key, start_offset, end_offset)
 
+    def get_iter(self, key, chunk_size=None, offset=0):
+        """
+        iterate over the value of key in chunks of chunk_size, starting from offset,
+        without the server or the client having to hold the whole value in a single reply
+        """
+        if offset < 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "offset argument should be >= 0"
+            )
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+        elif chunk_size <= 0:
+            raise mlrun.errors.MLRunInvalidArgumentError(
+                "chunk_size argument should be > 0"
+            )
+        # the arguments are validated on the call rather than on the first iteration
+        return self._iter_chunks(build_redis_key(key), chunk_size, offset)
+
+    def _iter_chunks(self, key, chunk_size, offset):
+        while True:
+            # queue several windows per round-trip to keep the connection busy
+            pipe = self.redis.pipeline(transaction=False)
+            for _ in range(self.chunks_per_flush):
+                pipe.getrange(key, offset, offset + chunk_size - 1)
+                offset += chunk_size
+            for data in pipe.execute():
+                if data:
+                    yield data
+                if len(data) < chunk_size:
+                    return
+
+    def download(self, key, target_path):
+        with open(target_path, "wb") as fp:
+            for data in self.get_iter(key):
+                fp.write(data)
+
     def put(self, key, data, append=False):
-        key = RedisStore.build_redis_key(key)
+        key = build_redis_key(key)
         if append:
             self.redis.append(key, data)
         else:
@@ -137,12 +277,17 @@ class RedisStore(DataStore):
         """
         list all keys with prefix key
         """
-        response = []
-        key = RedisStore.build_redis_key(key, prefix_only=True)
+        return list(self.ilistdir(key))
+
+    def ilistdir(self, key):
+        """
+        iterate over all keys with prefix key, without holding the whole listing in memory
+        """
+        key = build_redis_key(key, prefix_only=True)
         key += "*" if key.endswith("/") else "/*"
-        for key in self.redis.scan_iter(key):
-            response.append(RedisStore.build_mlrun_key(key))
-        return response
+        for key in self.redis.scan_iter(match=key, count=self.scan_count):
+            # strip the '{' '}' hashtag, same as build_mlrun_key
+            yield key[1:-1].decode()
 
     def rm(self, key, recursive=False, maxdepth=None):
         """
@@ -151,14 +296,47 @@ class RedisStore(DataStore):
         if maxdepth is not None:
             raise NotImplementedError("maxdepth is not supported")
 
-        key = RedisStore.build_redis_key(key, prefix_only=recursive)
+        key = build_redis_key(key, prefix_only=recursive)
 
         if recursive:
             key += "*" if key.endswith("/") else "/*"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
-            key = f"_spark:{key}"
-            for k in self.redis.scan_iter(key):
-                self.redis.delete(k)
+            self._unlink_matching(key)
+            self._unlink_matching(f"_spark:{key}")
         else:
-            self.redis.delete(key)
+            self.redis.unlink(key)
+
+    def _unlink_matching(self, pattern):
+        if isinstance(self.redis, redis.cluster.RedisCluster):
+            # each primary is scanned on its own, so every page's keys are unlinked in a pipeline that reaches
+            # a single node. the keys are unlinked one per command since each one is in a slot of its own
+            for node in self.redis.get_primaries():
+                cursor = 0
+                while True:
+                    cursors, keys = self.redis.scan(
+                        cursor=cursor,
+                        match=pattern,
+                        count=self.scan_count,
+                        target_nodes=node,
+                    )
+                    cursor = cursors[node.name]
+                    if keys:
+                        pipe = self.redis.pipeline(transaction=False)
+                        for key in keys:
+                            pipe.unlink(key)
+                        pipe.execute()
+                    if cursor == 0:
+                        break
+            return
+
+        cursor = 0
+        while True:
+            cursor = self.redis.execute_command(
+                "EVAL",
+                _unlink_scan_page_script,
+                0,
+                cursor,
+                pattern,
+                self.scan_count,
+            )
+            if int(cursor) == 0:
+                break
@@ -1243,7 +1243,12 @@ def get_handler_extended(
 def datetime_from_iso(time_str: str) -> Optional[datetime]:
     if not time_str:
         return
-    return parser.isoparse(time_str)
+    try:
+        # fromisoformat is implemented in C and is much faster than dateutil's parser
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        # prior to python 3.11 fromisoformat supports only the formats emitted by isoformat()
+        return parser.isoparse(time_str)
 
 
 def datetime_to_iso(time_obj: Optional[datetime]) -> Optional[str]:
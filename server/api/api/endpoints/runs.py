@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
 import datetime
+import json
 from http import HTTPStatus
 from typing import List
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
@@ -31,6 +34,11 @@ from server.api.api.utils import log_and_raise
 
 router = APIRouter()
 
+# list_runs defaults when no filter is given
+_default_runs_start_time_delta = datetime.timedelta(days=7)
+_default_runs_partition_by = mlrun.common.schemas.RunPartitionByField.name
+_default_runs_partition_sort_by = mlrun.common.schemas.SortField.updated
+
 
 # TODO: remove /run/{project}/{uid} in 1.7.0
 @router.post(
@@ -63,7 +71,7 @@ async def store_run(
     )
     data = None
     try:
-        data = await request.json()
+        data = await _get_request_json(request)
     except ValueError:
         log_and_raise(HTTPStatus.BAD_REQUEST.value, reason="bad JSON body")
 
@@ -103,7 +111,7 @@ async def update_run(
     )
     data = None
     try:
-        data = await request.json()
+        data = await _get_request_json(request)
     except ValueError:
         log_and_raise(HTTPStatus.BAD_REQUEST.value, reason="bad JSON body")
 
@@ -133,16 +141,26 @@ async def get_run(
     auth_info: mlrun.common.schemas.AuthInfo = Depends(deps.authenticate_request),
     db_session: Session = Depends(deps.get_db_session),
 ):
-    data = await run_in_threadpool(
-        server.api.crud.Runs().get_run, db_session, uid, iter, project
-    )
-    await server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
-        mlrun.common.schemas.AuthorizationResourceTypes.run,
-        project,
-        uid,
-        mlrun.common.schemas.AuthorizationAction.read,
-        auth_info,
+    # the run is fetched while the permissions are being queried, it is returned only if the query succeeded
+    get_run_task = asyncio.create_task(
+        run_in_threadpool(
+            server.api.crud.Runs().get_run, db_session, uid, iter, project
+        )
     )
+    try:
+        await server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
+            mlrun.common.schemas.AuthorizationResourceTypes.run,
+            project,
+            uid,
+            mlrun.common.schemas.AuthorizationAction.read,
+            auth_info,
+        )
+    except BaseException:
+        # the fetch runs in a thread which can't be cancelled, wait for it to finish with the db session before
+        # the session is closed, its result (or error) is discarded
+        await asyncio.gather(get_run_task, return_exceptions=True)
+        raise
+    data = await get_run_task
     return {
         "data": data,
     }
@@ -223,26 +241,28 @@ async def list_runs(
             auth_info,
         )
 
-    if (
-        not name
-        and not uid
-        and not labels
-        and not state
-        and not last
-        and not start_time_from
-        and not start_time_to
-        and not last_update_time_from
-        and not last_update_time_to
-        and not partition_by
-        and not partition_sort_by
-        and not iter
+    if not any(
+        (
+            name,
+            uid,
+            labels,
+            state,
+            last,
+            start_time_from,
+            start_time_to,
+            last_update_time_from,
+            last_update_time_to,
+            partition_by,
+            partition_sort_by,
+            iter,
+        )
     ):
         # default to last week on no filter
         start_time_from = (
-            datetime.datetime.now() - datetime.timedelta(days=7)
+            datetime.datetime.now() - _default_runs_start_time_delta
         ).isoformat()
-        partition_by = mlrun.common.schemas.RunPartitionByField.name
-        partition_sort_by = mlrun.common.schemas.SortField.updated
+        partition_by = _default_runs_partition_by
+        partition_sort_by = _default_runs_partition_sort_by
 
     runs = await run_in_threadpool(
         server.api.crud.Runs().list_runs,
@@ -327,16 +347,15 @@ async def delete_runs(
             run.get("metadata", {}).get("project", mlrun.mlconf.default_project)
             for run in runs
         )
-        for run_project in projects:
-            # currently we fail if the user doesn't has permissions to delete runs to one of the projects in the system
-            # TODO Delete only runs from projects that user has permissions to
-            await server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions(
-                mlrun.common.schemas.AuthorizationResourceTypes.run,
-                run_project,
-                "",
-                mlrun.common.schemas.AuthorizationAction.delete,
-                auth_info,
-            )
+        # currently we fail if the user doesn't has permissions to delete runs to one of the projects in the system
+        # TODO Delete only runs from projects that user has permissions to
+        await server.api.utils.auth.verifier.AuthVerifier().query_project_resources_permissions(
+            mlrun.common.schemas.AuthorizationResourceTypes.run,
+            list(projects),
+            lambda run_project: (run_project, ""),
+            mlrun.common.schemas.AuthorizationAction.delete,
+            auth_info,
+        )
 
     await run_in_threadpool(
         server.api.crud.Runs().delete_runs,
@@ -414,7 +433,7 @@ async def abort_run(
 
     data = None
     try:
-        data = await request.json()
+        data = await _get_request_json(request)
     except ValueError:
         log_and_raise(HTTPStatus.BAD_REQUEST.value, reason="bad JSON body")
 
@@ -434,3 +453,13 @@ async def abort_run(
     )
 
     return background_task
+
+
+async def _get_request_json(request: Request):
+    # orjson parses straight from the body bytes, and much faster than starlette's json.loads
+    body = await request.body()
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        # orjson is strict about non-standard values like NaN, which the client's json.dumps may emit
+        return json.loads(body)
@@ -123,15 +123,19 @@ class Provider(
         opa_resources = []
         for resource in resources:
             opa_resources.append(opa_resource_extractor(resource))
+        # many resources may map to the same opa resource, query (and check the cache for) each one only once
+        unique_opa_resources = list(dict.fromkeys(opa_resources))
         allowed_by_cache = True
-        for opa_resource in opa_resources:
+        for opa_resource in unique_opa_resources:
             # allow by cache only if all resources allowed by cache
             if not self._check_allowed_project_owners_cache(opa_resource, auth_info):
                 allowed_by_cache = False
                 break
         if allowed_by_cache:
             return resources
-        body = self._generate_filter_request_body(opa_resources, action, auth_info)
+        body = self._generate_filter_request_body(
+            unique_opa_resources, action, auth_info
+        )
         if self._log_level > 5:
             logger.debug("Sending filter request to OPA", body=body)
         async with self._send_request_to_api(
@@ -140,7 +144,7 @@ class Provider(
             response_body = await response.json()
         if self._log_level > 5:
             logger.debug("Received filter response from OPA", body=response_body)
-        allowed_opa_resources = response_body["result"]
+        allowed_opa_resources = set(response_body["result"])
         allowed_resources = []
         for index, opa_resource in enumerate(opa_resources):
             if opa_resource in allowed_opa_resources:
@@ -578,6 +578,27 @@ def test_delete_runs_without_permissions(db: Session, client: TestClient):
     assert len(runs) == 1
 
 
+def test_get_run_permissions(db: Session, client: TestClient):
+    project = "some-project"
+    uid = "some-uid"
+    _store_run(db, uid=uid, project=project)
+    run_api = f"{RUNS_API_V1.format(project=project)}/{{uid}}"
+
+    response = client.get(run_api.format(uid=uid))
+    assert response.status_code == HTTPStatus.OK.value
+    response = client.get(run_api.format(uid="missing-uid"))
+    assert response.status_code == HTTPStatus.NOT_FOUND.value
+
+    server.api.utils.auth.verifier.AuthVerifier().query_project_resource_permissions = (
+        unittest.mock.AsyncMock(side_effect=mlrun.errors.MLRunAccessDeniedError())
+    )
+    response = client.get(run_api.format(uid=uid))
+    assert response.status_code == HTTPStatus.FORBIDDEN.value
+    # the permissions error takes precedence over the run not being found
+    response = client.get(run_api.format(uid="missing-uid"))
+    assert response.status_code == HTTPStatus.FORBIDDEN.value
+
+
 def test_store_run_masking(db: Session, client: TestClient, k8s_secrets_mock):
     notifications = [
         {
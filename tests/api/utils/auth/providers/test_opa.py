@@ -134,7 +134,11 @@ async def test_filter_by_permission(
     )
 
     def mock_filter_query_success(url, **kwargs):
-        opa_resources = [resource["opa_resource"] for resource in resources]
+        # each opa resource is expected to be sent once
+        opa_resources = list(
+            dict.fromkeys(resource["opa_resource"] for resource in resources)
+        )
+        assert len(kwargs["json"]["input"]["resources"]) == len(opa_resources)
         assert (
             deepdiff.DeepDiff(
                 opa_provider._generate_filter_request_body(
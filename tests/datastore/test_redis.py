@@ -0,0 +1,337 @@
+# Copyright 2023 Iguazio
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import collections
+import fnmatch
+import threading
+import unittest.mock
+
+import pytest
+import redis
+import redis.cluster
+
+import mlrun.datastore.redis
+from mlrun.datastore.redis import RedisStore
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self._commands.append((name, args))
+
+        return queue
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        self._client.executed_pipelines.append([name for name, _ in commands])
+        return [getattr(self._client, name)(*args) for name, args in commands]
+
+
+class FakeRedis:
+    """in-memory stand-in for the redis client, recording the pipelines executed on it"""
+
+    def __init__(self):
+        self.values = {}
+        self.executed_pipelines = []
+        self.executed_commands = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value):
+        self.values[key] = bytes(value)
+
+    def append(self, key, value):
+        self.values[key] = self.values.get(key, b"") + value
+
+    def getrange(self, key, start, end):
+        value = self.values.get(key, b"")
+        return value[start:] if end == -1 else value[start : end + 1]
+
+    def unlink(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    def scan_iter(self, match=None, count=None):
+        return [key for key in list(self.values) if fnmatch.fnmatchcase(key, match)]
+
+    def execute_command(self, *args, **kwargs):
+        self.executed_commands.append((args, kwargs))
+        command, _, _, cursor, pattern, _ = args
+        assert command == "EVAL"
+        # the server side scan is emulated as a single page
+        self.unlink(*self.scan_iter(match=pattern))
+        return b"0"
+
+    def close(self):
+        pass
+
+
+class FakeRedisCluster(FakeRedis, redis.cluster.RedisCluster):
+    """holds the keys of each primary node separately, scanned one key per page"""
+
+    def __init__(self, node_names):
+        super().__init__()
+        self.nodes = [redis.cluster.ClusterNode(name, 6379) for name in node_names]
+        # keys by node host
+        self.node_keys = {node.host: [] for node in self.nodes}
+        self.scanned_nodes = []
+
+    def get_primaries(self):
+        return self.nodes
+
+    def scan(self, cursor=0, match=None, count=None, target_nodes=None):
+        self.scanned_nodes.append(target_nodes.host)
+        keys = self.node_keys[target_nodes.host]
+        page = [
+            key for key in keys[cursor : cursor + 1] if fnmatch.fnmatchcase(key, match)
+        ]
+        next_cursor = cursor + 1 if cursor + 1 < len(keys) else 0
+        return {target_nodes.name: next_cursor}, page
+
+    def scan_iter(self, match=None, count=None):
+        raise AssertionError("the cluster is expected to be scanned per node")
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    monkeypatch.setattr(RedisStore, "chunk_size", 10)
+    monkeypatch.setattr(RedisStore, "chunks_per_flush", 3)
+    parent = unittest.mock.Mock()
+    parent.secret.return_value = None
+    store = RedisStore(parent, "redis", "redis", endpoint="redis://localhost:6379")
+    store._redis = FakeRedis()
+    return store
+
+
+@pytest.mark.parametrize(
+    "size, expected_pipelines",
+    [
+        # fits in a single chunk - a single SET, no pipeline
+        (10, []),
+        # the first chunk is set and the rest appended, flushed every 3 commands and once more at the end
+        (
+            75,
+            [
+                ["set", "append", "append"],
+                ["append", "append", "append"],
+                ["append", "append"],
+            ],
+        ),
+        # no leftover commands - no final flush
+        (60, [["set", "append", "append"], ["append", "append", "append"]]),
+    ],
+)
+def test_upload(redis_store, tmp_path, size, expected_pipelines):
+    expected = bytes(range(size))
+    src_path = tmp_path / "src"
+    src_path.write_bytes(expected)
+    # upload replaces the existing value
+    redis_store._redis.values["{/object}"] = b"previous value"
+
+    redis_store.upload("redis:///object", str(src_path))
+
+    assert redis_store._redis.values["{/object}"] == expected
+    assert redis_store._redis.executed_pipelines == expected_pipelines
+
+
+@pytest.fixture
+def redis_clients(monkeypatch):
+    monkeypatch.setattr(
+        mlrun.datastore.redis, "_redis_clients", collections.OrderedDict()
+    )
+    monkeypatch.setattr(mlrun.datastore.redis, "_redis_url_locks", {})
+    monkeypatch.setattr(mlrun.datastore.redis, "_max_redis_clients", 2)
+    created_urls = []
+
+    def create_redis_client(url):
+        created_urls.append(url)
+        return object()
+
+    monkeypatch.setattr(
+        mlrun.datastore.redis, "_create_redis_client", create_redis_client
+    )
+    return created_urls
+
+
+def test_get_redis_client_shared_and_bounded(redis_clients):
+    client = mlrun.datastore.redis._get_redis_client("redis://host-1")
+    assert mlrun.datastore.redis._get_redis_client("redis://host-1") is client
+    assert redis_clients == ["redis://host-1"]
+
+    # exceeding the limit evicts the oldest client, which is then recreated on demand
+    mlrun.datastore.redis._get_redis_client("redis://host-2")
+    mlrun.datastore.redis._get_redis_client("redis://host-3")
+    assert list(mlrun.datastore.redis._redis_clients) == [
+        "redis://host-2",
+        "redis://host-3",
+    ]
+    assert mlrun.datastore.redis._get_redis_client("redis://host-1") is not client
+    assert redis_clients == [
+        "redis://host-1",
+        "redis://host-2",
+        "redis://host-3",
+        "redis://host-1",
+    ]
+
+
+def test_get_redis_client_slow_url_does_not_block_others(redis_clients, monkeypatch):
+    creating_slow_client = threading.Event()
+    release_slow_client = threading.Event()
+
+    def create_redis_client(url):
+        if url == "redis://slow":
+            creating_slow_client.set()
+            release_slow_client.wait()
+        return object()
+
+    monkeypatch.setattr(
+        mlrun.datastore.redis, "_create_redis_client", create_redis_client
+    )
+    slow_thread = threading.Thread(
+        target=mlrun.datastore.redis._get_redis_client, args=("redis://slow",)
+    )
+    slow_thread.start()
+    try:
+        assert creating_slow_client.wait(5)
+        # returns while the slow url is still being created
+        assert mlrun.datastore.redis._get_redis_client("redis://fast") is not None
+    finally:
+        release_slow_client.set()
+        slow_thread.join()
+    assert "redis://slow" in mlrun.datastore.redis._redis_clients
+
+
+@pytest.mark.parametrize("pool_size", [None, 10])
+def test_create_redis_client_kwargs(pool_size):
+    mlrun.mlconf.redis.connections_pool_size = pool_size
+    mlrun.mlconf.redis.health_check_interval = 15
+    with unittest.mock.patch.object(
+        redis.cluster.RedisCluster, "from_url"
+    ) as cluster_from_url, unittest.mock.patch.object(
+        redis.Redis, "from_url"
+    ) as standalone_from_url:
+        mlrun.datastore.redis._create_redis_client("redis://host")
+        cluster_kwargs = cluster_from_url.call_args.kwargs
+        # the pool is unbounded unless a size is configured
+        assert cluster_kwargs.get("max_connections") == pool_size
+        assert "health_check_interval" not in cluster_kwargs
+        standalone_from_url.assert_not_called()
+
+        cluster_from_url.side_effect = redis.cluster.RedisClusterException()
+        mlrun.datastore.redis._create_redis_client("redis://host")
+        standalone_kwargs = standalone_from_url.call_args.kwargs
+        assert standalone_kwargs.get("max_connections") == pool_size
+        assert standalone_kwargs["health_check_interval"] == 15
+
+
+def test_rm_recursive(redis_store):
+    client = FakeRedis()
+    redis_store._redis = client
+    keep_keys = ["{/dir-2/obj}", "{/dir-1}"]
+    remove_keys = ["{/dir-1/obj-1}", "{/dir-1/sub/obj-2}", "_spark:{/dir-1/obj-3}"]
+    for key in keep_keys + remove_keys:
+        client.values[key] = b"value"
+
+    redis_store.rm("redis:///dir-1", recursive=True)
+
+    assert sorted(client.values) == sorted(keep_keys)
+    # a script per pattern, one for the keys and one for their spark metadata
+    assert [args[0] for args, _ in client.executed_commands] == ["EVAL", "EVAL"]
+
+
+def test_rm_recursive_cluster(redis_store):
+    client = FakeRedisCluster(["node-1", "node-2"])
+    redis_store._redis = client
+    node_keys = {
+        "node-1": ["{/dir-1/obj-1}", "{/dir-2/obj}", "{/dir-1/obj-2}"],
+        "node-2": ["{/dir-1/sub/obj-3}", "_spark:{/dir-1/obj-1}"],
+    }
+    for node_name, keys in node_keys.items():
+        client.node_keys[node_name] = keys
+        for key in keys:
+            client.values[key] = b"value"
+
+    redis_store.rm("redis:///dir-1", recursive=True)
+
+    assert sorted(client.values) == ["{/dir-2/obj}"]
+    # no script on a cluster
+    assert client.executed_commands == []
+    # every node is scanned page by page for each of the two patterns
+    assert client.scanned_nodes == (["node-1"] * 3 + ["node-2"] * 2) * 2
+    # a pipeline per page which matched, a single key per UNLINK
+    assert client.executed_pipelines == [["unlink"]] * 4
+
+
+@pytest.mark.parametrize(
+    "size, offset, chunk_size, expected_chunk_sizes, expected_pipelines_count",
+    [
+        # missing value
+        (0, 0, None, [], 1),
+        # a short read ends the first window
+        (5, 0, None, [5], 1),
+        # exact multiple of the chunk size - ended by the empty read after the last chunk
+        (30, 0, None, [10, 10, 10], 2),
+        # multiple rounds of windows ending in a short read
+        (75, 0, None, [10] * 7 + [5], 3),
+        (75, 7, None, [10] * 6 + [8], 3),
+        (75, 0, 25, [25, 25, 25], 2),
+    ],
+)
+def test_get_iter(
+    redis_store,
+    size,
+    offset,
+    chunk_size,
+    expected_chunk_sizes,
+    expected_pipelines_count,
+):
+    value = bytes(range(size))
+    if value:
+        redis_store._redis.values["{/object}"] = value
+
+    chunks = list(
+        redis_store.get_iter("redis:///object", chunk_size=chunk_size, offset=offset)
+    )
+
+    assert [len(chunk) for chunk in chunks] == expected_chunk_sizes
+    assert b"".join(chunks) == value[offset:]
+    assert (
+        redis_store._redis.executed_pipelines
+        == [["getrange"] * redis_store.chunks_per_flush] * expected_pipelines_count
+    )
+
+
+@pytest.mark.parametrize("offset, chunk_size", [(-1, None), (0, 0), (0, -1)])
+def test_get_iter_invalid_arguments(redis_store, offset, chunk_size):
+    # raised on the call, before iterating
+    with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
+        redis_store.get_iter("redis:///object", chunk_size=chunk_size, offset=offset)
+
+
+def test_download(redis_store, tmp_path):
+    value = bytes(range(256))
+    redis_store._redis.values["{/object}"] = value
+    target_path = tmp_path / "target"
+
+    redis_store.download("redis:///object", str(target_path))
+
+    assert target_path.read_bytes() == value
@@ -21,6 +21,7 @@ from mlrun.datastore.datastore_profile import (
     DatastoreProfileRedis,
     register_temporary_client_datastore_profile,
 )
+from mlrun.datastore.redis import RedisStore
 from tests.system.base import TestMLRunSystem
 
 redis_endpoints = ["redis://", "redis://localhost:6379"]
@@ -53,19 +54,19 @@ class TestRedisDataStore(TestMLRunSystem):
 
         # no "size", "offset": return the entire object
         object_value = data_item.get()
-        assert object_value == "".join(str_arr)
+        assert object_value == "".join(str_arr).encode()
         # no "size": returns from "offset" to end of object
         object_value = data_item.get(offset=len(str_arr[0]))
-        assert object_value == "".join(str_arr[1:])
+        assert object_value == "".join(str_arr[1:]).encode()
         # "size"=0 is forbidden
         with pytest.raises(mlrun.errors.MLRunInvalidArgumentError):
             object_value = data_item.get(offset=1, size=0)
         # "size">0: return the first "size" bytes
         object_value = data_item.get(size=len(str_arr[0]))
-        assert object_value == str_arr[0]
+        assert object_value == str_arr[0].encode()
         # "size">0 "offset">0: return "size" bytes starting from byte "offset"
         object_value = data_item.get(offset=len(str_arr[0]), size=len(str_arr[1]))
-        assert object_value == str_arr[1]
+        assert object_value == str_arr[1].encode()
 
         data_item.delete()
 
@@ -100,6 +101,62 @@ class TestRedisDataStore(TestMLRunSystem):
 
         assert expected == actual
 
+    def test_redis_upload_download_binary_object(self):
+        redis_path = "redis:///test_binary_object"
+        # bytes which are not valid utf-8
+        expected = bytes(range(256)) * 100
+        with open("temp_upload", "wb") as f:
+            f.write(expected)
+        data_item = mlrun.datastore.store_manager.object(redis_path)
+
+        data_item.delete()
+
+        data_item.upload("temp_upload")
+        data_item.download("temp_download")
+
+        with open("temp_download", "rb") as f:
+            actual = f.read()
+
+        assert data_item.get() == expected
+        data_item.delete()
+        os.remove("temp_upload")
+        os.remove("temp_download")
+
+        assert expected == actual
+
+    @pytest.mark.parametrize(
+        "size",
+        [
+            # exact multiple of the pipelined batch - no leftover flush
+            1024 * 6,
+            # mid-loop flushes and a final flush of the leftover chunks
+            1024 * 7 + 100,
+        ],
+    )
+    def test_redis_chunked_upload_download_object(self, monkeypatch, size):
+        monkeypatch.setattr(RedisStore, "chunk_size", 1024)
+        monkeypatch.setattr(RedisStore, "chunks_per_flush", 3)
+        redis_path = "redis:///test_chunked_object"
+        expected = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+        with open("temp_upload", "wb") as f:
+            f.write(expected)
+        data_item = mlrun.datastore.store_manager.object(redis_path)
+
+        # the upload is expected to replace the existing value rather than append to it
+        data_item.put("previous value")
+        data_item.upload("temp_upload")
+        data_item.download("temp_download")
+
+        with open("temp_download", "rb") as f:
+            actual = f.read()
+
+        assert data_item.get() == expected
+        data_item.delete()
+        os.remove("temp_upload")
+        os.remove("temp_download")
+
+        assert expected == actual
+
     def test_redis_listdir(self):
 
         redis_path = "redis://"
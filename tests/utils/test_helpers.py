@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import datetime
 import re
 import unittest.mock
 from contextlib import nullcontext as does_not_raise
@@ -27,6 +28,7 @@ from mlrun.datastore.store_resources import parse_store_uri
 from mlrun.utils import logger
 from mlrun.utils.helpers import (
     StorePrefix,
+    datetime_from_iso,
     enrich_image_url,
     extend_hub_uri_if_needed,
     fill_project_path_template,
@@ -928,3 +930,24 @@ def test_retry_until_successful():
 def test_iterate_list_by_chunks(iterable_list, chunk_size, expected_chunked_list):
     chunked_list = mlrun.utils.iterate_list_by_chunks(iterable_list, chunk_size)
     assert list(chunked_list) == expected_chunked_list
+
+
+@pytest.mark.parametrize(
+    "time_str, expected",
+    [
+        (None, None),
+        ("", None),
+        ("2023-01-02T03:04:05", datetime.datetime(2023, 1, 2, 3, 4, 5)),
+        (
+            "2023-01-02T03:04:05.123456+00:00",
+            datetime.datetime(2023, 1, 2, 3, 4, 5, 123456, datetime.timezone.utc),
+        ),
+        (
+            "2023-01-02T03:04:05Z",
+            datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        ),
+        ("20230102T030405", datetime.datetime(2023, 1, 2, 3, 4, 5)),
+    ],
+)
+def test_datetime_from_iso(time_str, expected):
+    assert datetime_from_iso(time_str) == expected